@@ -18,6 +18,7 @@ from os import environ, utime
 
 import argparse
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import warnings
 import zipfile
@@ -133,7 +134,13 @@ class BuildDocumentation(object):
         )
         parser.add_argument(
             "--clean",
-            help="clean for a full regeneration of the documentation",
+            help="clean for a regeneration of the documentation "
+            "(the doctree cache is kept for faster incremental rebuilds)",
+            action="store_true",
+        )
+        parser.add_argument(
+            "--clean-all",
+            help="clean everything, including the doctree cache",
             action="store_true",
         )
         parser.add_argument("--delnb", help="delete all ipynb", action="store_true")
@@ -164,11 +171,11 @@ class BuildDocumentation(object):
 
         self.regenerate_api = args.api
 
-        if args.clean and args.html:
-            self.clean("html")
+        if (args.clean or args.clean_all) and args.html:
+            self.clean("html", doctrees=args.clean_all)
 
-        if args.clean and args.pdf:
-            self.clean("latex")
+        if (args.clean or args.clean_all) and args.pdf:
+            self.clean("latex", doctrees=args.clean_all)
 
         if args.html:
             # self.sync_notebook = True
@@ -180,8 +187,18 @@ class BuildDocumentation(object):
             self.make_pdf()
 
         if args.all:
-            self.make_docs("html", clean=True)
-            self.make_docs("latex", clean=True)
+            # The two builds stay sequential: both Sphinx apps write into
+            # the shared source-tree directories (autosummary API rst,
+            # sphinx-gallery output, the py/ipynb pairs handled by delnb),
+            # so running them concurrently races on the doc sources.  The
+            # html build regenerates those shared trees once; the latex
+            # build then reuses them (regenerate_api is reset after the
+            # first removal).
+            self.clean("html", doctrees=True)
+            self.clean("latex", doctrees=True)
+            self.regenerate_api = True
+            self.make_docs("html")
+            self.make_docs("latex")
             self.make_pdf()
             self.zip_tutorials()
 
@@ -226,12 +243,18 @@ class BuildDocumentation(object):
         if self.regenerate_api:
             shutil.rmtree(API, ignore_errors=True)
             print(f"remove {API}")
+            # the regenerated API rst files do not depend on the builder:
+            # remove them at most once per process, so a subsequent build
+            # (e.g. latex after html with --all) reuses the generated tree
+            self.regenerate_api = False
 
         # run sphinx
         print(f"\n{builder.upper()} BUILDING:")
         srcdir = confdir = DOCS
         outdir = f"{BUILDDIR}/{doc_version}"
-        doctreesdir = f"{DOCTREES}/{doc_version}"
+        # each builder keeps its own doctree cache, so one builder's
+        # incremental state never invalidates the other's
+        doctreesdir = f"{DOCTREES}/{doc_version}-{builder}"
         sp = Sphinx(srcdir, confdir, outdir, doctreesdir, builder)
         sp.verbosity = 1
         sp.build()
@@ -416,27 +439,30 @@ class BuildDocumentation(object):
         )
 
     # ..........................................................................
-    def clean(self, builder):
+    def clean(self, builder, doctrees=False):
         # Clean/remove the built documentation.
+        # The doctree cache is kept unless doctrees=True: a fresh Sphinx
+        # app then rebuilds incrementally, which is much faster for
+        # iterative documentation work.
 
         print(f'\n{"-" * 80}\nCleaning\n{"-" * 80}')
 
         doc_version = self.doc_version
 
         if builder == "html":
-            shutil.rmtree(HTML / doc_version, ignore_errors=True)
-            print(f"removed {HTML / doc_version}")
-            shutil.rmtree(DOCTREES / doc_version, ignore_errors=True)
-            print(f"removed {DOCTREES / doc_version}")
-            shutil.rmtree(API, ignore_errors=True)
-            print(f"removed {API}")
-            shutil.rmtree(DEV_API, ignore_errors=True)
-            print(f"removed {DEV_API}")
-            shutil.rmtree(GALLERY, ignore_errors=True)
-            print(f"removed {GALLERY}")
+            paths = [HTML / doc_version, API, DEV_API, GALLERY]
         else:
-            shutil.rmtree(LATEX / doc_version, ignore_errors=True)
-            print(f"remove {LATEX / doc_version}")
+            paths = [LATEX / doc_version]
+
+        if doctrees:
+            paths.append(DOCTREES / f"{doc_version}-{builder}")
+
+        # the generated trees hold thousands of small files: removing them
+        # concurrently parallelizes the unlink syscalls
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            executor.map(lambda p: shutil.rmtree(p, ignore_errors=True), paths)
+        for p in paths:
+            print(f"removed {p}")
 
     # ..........................................................................
     def make_dirs(self):
@@ -450,7 +476,8 @@ class BuildDocumentation(object):
             DOCTREES,
             HTML,
             LATEX,
-            DOCTREES / doc_version,
+            DOCTREES / f"{doc_version}-html",
+            DOCTREES / f"{doc_version}-latex",
             HTML / doc_version,
             LATEX / doc_version,
             DOWNLOADS,
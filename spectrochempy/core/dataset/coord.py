@@ -163,6 +163,11 @@ class Coord(NDMath, NDArray):
     # ------------------------------------------------------------------------
     def __init__(self, data=None, **kwargs):
 
+        # fail fast on multidimensional input: np.ndim does not copy the
+        # data, while the full init path below would
+        if data is not None and np.ndim(data) > 1:
+            raise ValueError("Only one 1D arrays can be used to define coordinates")
+
         super().__init__(data=data, **kwargs)
 
         if len(self.shape) > 1:
@@ -178,17 +183,35 @@ class Coord(NDMath, NDArray):
     # readonly property
     # ------------------------------------------------------------------------
 
+    # a memoized `reversed` flag: the test involves unit comparisons and
+    # substring searches, and the plotting code queries it repeatedly
+    _reversed_cache = None
+
+    @observe("_units", "_title")
+    def _reversed_cache_reset(self, change):
+        self._reversed_cache = None
+
+    @observe("_offset", "_increment", "_size", "_linear")
+    def _loc2index_cache_reset_linear(self, change):
+        # for linear coordinates the data derive from these traits: drop
+        # the cached lookup helpers (see NDArray._loc2index)
+        self._loc2index_cache = None
+
     # ..........................................................................
     @property
     def reversed(self):
         """bool - Whether the axis is reversed (readonly
         property).
         """
-        if self.units == "ppm":
-            return True
-        elif self.units == "1 / centimeter" and "raman" not in self.title.lower():
-            return True
-        return False
+        if self._reversed_cache is None:
+            if self.units == "ppm":
+                val = True
+            elif self.units == "1 / centimeter" and "raman" not in self.title.lower():
+                val = True
+            else:
+                val = False
+            self._reversed_cache = val
+        return self._reversed_cache
 
         # Return a correct result only if the data are sorted  # return  # bool(self.data[0] > self.data[-1])
 
@@ -722,24 +745,28 @@ class Coord(NDMath, NDArray):
 
         indent = kwargs.get("indent", 0)
 
-        out = ""
+        # build the pieces in a list and join once: repeated concatenation
+        # reallocates the whole string at each step
+        parts = []
         if not self.is_empty and print_size:
-            out += f"{self._str_shape().rstrip()}\n"
-        out += f"        title: {self.title}\n" if self.title else ""
+            parts.append(f"{self._str_shape().rstrip()}\n")
+        if self.title:
+            parts.append(f"        title: {self.title}\n")
         if self.has_data:
-            out += "{}\n".format(self._str_value(header=header))
+            parts.append(f"{self._str_value(header=header)}\n")
         elif self.is_empty and not self.is_labeled:
-            out += header.replace("...", "\0Undefined\0")
+            parts.append(header.replace("...", "\0Undefined\0"))
 
         if self.is_labeled:
             header = "       labels: ... \n"
             text = str(self.labels.T).strip()
             if "\n" not in text:  # single line!
-                out += header.replace("...", "\0\0{}\0\0".format(text))
+                parts.append(header.replace("...", f"\0\0{text}\0\0"))
             else:
-                out += header
-                out += "\0\0{}\0\0".format(textwrap.indent(text.strip(), " " * 9))
+                parts.append(header)
+                parts.append(f"\0\0{textwrap.indent(text.strip(), ' ' * 9)}\0\0")
 
+        out = "".join(parts)
         if out[-1] == "\n":
             out = out[:-1]
 
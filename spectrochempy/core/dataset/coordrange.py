@@ -10,6 +10,7 @@ This module implements the class _CoordRange.
 
 __all__ = __slots__ = ["trim_ranges"]
 
+import numpy as np
 from traitlets import HasTraits, List, Bool
 
 from spectrochempy.utils.traits import Range
@@ -34,12 +35,10 @@ class _CoordRange(HasTraits):
             # second case: a pair of scalars has been passed
             # using the Interval class, we have autochecking of the interval
             # validity
-            self.ranges = [list(map(float, ranges))]
+            self._clean_ranges([list(map(float, ranges))])
         else:
             # third case: a set of pairs of scalars has been passed
             self._clean_ranges(ranges)
-        if self.ranges:
-            self._clean_ranges(self.ranges)
 
     # ------------------------------------------------------------------------
     # private methods
@@ -55,16 +54,42 @@ class _CoordRange(HasTraits):
         """
         # transforms each pairs into valid interval
         # should generate an error if a pair is not valid
-        ranges = [list(range) for range in ranges]
-        # order the ranges
-        ranges = sorted(ranges, key=lambda r: min(r[0], r[1]))
-        cleaned_ranges = [ranges[0]]
-        for range in ranges[1:]:
-            if range[0] <= cleaned_ranges[-1][1]:
-                if range[1] >= cleaned_ranges[-1][1]:
-                    cleaned_ranges[-1][1] = range[1]
-            else:
-                cleaned_ranges.append(range)
+        ranges = [sorted(range) for range in ranges]
+
+        cleaned_ranges = None
+        if len(ranges) >= 8:
+            # the sort and merge is done in C for large sets of intervals
+            # (e.g. produced by interactive region selection); small sets
+            # stay on the Python path to avoid the NumPy dispatch overhead
+            try:
+                a = np.asarray(ranges, dtype=float)
+            except (TypeError, ValueError):
+                a = None
+            if a is not None:
+                a = a[a[:, 0].argsort()]
+                highs = np.maximum.accumulate(a[:, 1])
+                # an interval starts a new merged group iff its low bound
+                # exceeds the running maximum of the previous high bounds
+                starts = np.ones(len(a), dtype=bool)
+                starts[1:] = a[1:, 0] > highs[:-1]
+                first = np.flatnonzero(starts)
+                last = np.append(first[1:], len(a))
+                cleaned_ranges = [
+                    [float(a[i, 0]), float(highs[j - 1])]
+                    for i, j in zip(first, last)
+                ]
+
+        if cleaned_ranges is None:
+            # order the ranges
+            ranges = sorted(ranges, key=lambda r: r[0])
+            cleaned_ranges = [ranges[0]]
+            for range in ranges[1:]:
+                if range[0] <= cleaned_ranges[-1][1]:
+                    if range[1] >= cleaned_ranges[-1][1]:
+                        cleaned_ranges[-1][1] = range[1]
+                else:
+                    cleaned_ranges.append(range)
+
         self.ranges = cleaned_ranges
         if self.reversed:
             for range in self.ranges:
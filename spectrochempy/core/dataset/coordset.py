@@ -12,7 +12,6 @@ __all__ = ["CoordSet"]
 
 import copy as cpy
 import warnings
-import uuid
 
 import numpy as np
 from traitlets import (
@@ -32,6 +31,7 @@ from spectrochempy.core.dataset.ndarray import NDArray, DEFAULT_DIM_NAME
 from spectrochempy.core.dataset.coord import Coord, LinearCoord
 from spectrochempy.utils import (
     is_sequence,
+    make_id,
     colored_output,
     convert_to_html,
     SpectroChemPyWarning,
@@ -351,7 +351,7 @@ class CoordSet(HasTraits):
     @default("_id")
     def _id_default(self):
         # a unique id
-        return f"{type(self).__name__}_{str(uuid.uuid1()).split('-')[0]}"
+        return make_id(self)
 
     # ------------------------------------------------------------------------
     # Readonly Properties
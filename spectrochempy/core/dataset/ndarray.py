@@ -14,7 +14,6 @@ import copy as cpy
 import warnings
 import re
 import textwrap
-import uuid
 import itertools
 import pathlib
 from datetime import datetime, timezone
@@ -56,6 +55,7 @@ from spectrochempy.utils import (
     numpyprintoptions,
     insert_masked_print,
     SpectroChemPyWarning,
+    make_id,
     make_new_object,
     convert_to_html,
     get_user_and_node,
@@ -504,6 +504,10 @@ class NDArray(HasTraits):
         else:
             self._data[keys] = value
 
+        # in-place modification does not notify the traits machinery:
+        # invalidate the cached lookup helpers explicitly (see _loc2index)
+        self._loc2index_cache = None
+
     # ..........................................................................
     def __str__(self):
         return repr(self)
@@ -531,6 +535,21 @@ class NDArray(HasTraits):
         self._modified = datetime.now(timezone.utc)
         return
 
+    # ..........................................................................
+    # the cache-invalidation handlers below have unique names on purpose:
+    # subclasses (e.g. Coord) override _anytrait_changed without calling
+    # super, which would silently disable the invalidation
+
+    @observe("_data")
+    def _loc2index_cache_reset(self, change):
+        # the data have been replaced: drop the cached lookup helpers
+        # (see _loc2index)
+        self._loc2index_cache = None
+
+    @observe("_labels")
+    def _label_index_cache_reset(self, change):
+        self._label_index_cache = None
+
     # ..........................................................................
     def _argsort(self, by=None, pos=None, descend=False):
         # found the indices sorted by values or labels
@@ -757,13 +776,88 @@ class NDArray(HasTraits):
     @default("_id")
     def _id_default(self):
         # a unique id
-        return f"{type(self).__name__}_{str(uuid.uuid1()).split('-')[0]}"
+        return make_id(self)
 
     # ..........................................................................
     @default("_labels")
     def _labels_default(self):
         return None
 
+    # per-object caches used by _loc2index, invalidated whenever the data
+    # or the labels are replaced (see the *_cache_reset observers) or the
+    # data are modified through __setitem__
+    _loc2index_cache = None
+    _label_index_cache = None
+
+    # ..........................................................................
+    @property
+    def _label_index(self):
+        # lazily-built {label: index} mapping for O(1) label lookups, or
+        # None when the labels cannot be indexed this way (several series
+        # of labels, unhashable label objects, ...)
+        if self._label_index_cache is None:
+            labels = self._labels
+            index = None
+            if labels is not None and labels.ndim == 1:
+                try:
+                    index = {}
+                    for i, label in enumerate(labels):
+                        # keep the first occurrence, matching the
+                        # argwhere()[0] semantics
+                        index.setdefault(label, i)
+                except TypeError:  # pragma: no cover
+                    index = None
+            self._label_index_cache = (index,)
+        return self._label_index_cache[0]
+
+    # ..........................................................................
+    @property
+    def _loc2index_info(self):
+        # orientation, monotonicity and limits of the data, computed once
+        # per data assignment instead of once per lookup
+        if self._loc2index_cache is None:
+            data = self.data
+            if data.size > 1:
+                deltas = np.diff(data)
+                ascending = bool(data[-1] >= data[0])
+                monotonic = bool(
+                    (deltas >= 0).all() if ascending else (deltas <= 0).all()
+                )
+            else:
+                ascending = True
+                monotonic = True
+            self._loc2index_cache = {
+                "ascending": ascending,
+                "monotonic": monotonic,
+                "min": data.min() if data.size else None,
+                "max": data.max() if data.size else None,
+            }
+        return self._loc2index_cache
+
+    # ..........................................................................
+    def _nearest_index(self, data, loc):
+        # Return the index of the value of `data` closest to `loc`.
+        # Monotonic data (the usual case for coordinate axes) is searched
+        # by bisection, without the O(N) |data - loc| temporary;
+        # anything else falls back to a linear scan.
+        info = self._loc2index_info
+        if not info["monotonic"]:
+            return int((np.abs(data - loc)).argmin())
+        view = data if info["ascending"] else data[::-1]
+        index = int(np.searchsorted(view, loc))
+        if index == view.size:
+            index -= 1
+        elif index > 0:
+            dprev = loc - view[index - 1]
+            dnext = view[index] - loc
+            # on exact ties, match argmin by keeping the first index in
+            # the original data orientation
+            if dprev < dnext or (dprev == dnext and info["ascending"]):
+                index -= 1
+        if not info["ascending"]:
+            index = data.size - 1 - index
+        return index
+
     # ..........................................................................
     def _loc2index(self, loc, dim=None, *, units=None):
         # Return the index of a location (label or values such as coordinates) along a 1D array.
@@ -796,13 +890,14 @@ class NDArray(HasTraits):
             if is_number(loc):
                 # get the index of a given values
                 error = None
-                if np.all(loc > data.max()) or np.all(loc < data.min()):
+                info = self._loc2index_info
+                if loc > info["max"] or loc < info["min"]:
                     print_(
-                        f"This coordinate ({loc}) is outside the axis limits ({data.min()}-{data.max()}).\n"
+                        f"This coordinate ({loc}) is outside the axis limits ({info['min']}-{info['max']}).\n"
                         f"The closest limit index is returned"
                     )
                     error = "out_of_limits"
-                index = (np.abs(data - loc)).argmin()
+                index = self._nearest_index(data, loc)
                 # TODO: add some precision to this result
                 if not error:
                     return index
@@ -810,16 +905,18 @@ class NDArray(HasTraits):
                     return index, error
 
             elif is_sequence(loc):
-                # TODO: is there a simpler way to do this with numpy functions
-                index = []
-                for lo in loc:
-                    index.append(
-                        (np.abs(data - lo)).argmin()
-                    )  # TODO: add some precision to this result
-                return index
+                # TODO: add some precision to this result
+                return [self._nearest_index(data, lo) for lo in loc]
 
             elif self.is_labeled:
 
+                label_index = self._label_index
+                if label_index is not None:
+                    try:
+                        return label_index[loc]
+                    except (KeyError, TypeError):
+                        raise IndexError(f"Could not find this label: {loc}")
+
                 # TODO: look in all row of labels
                 labels = self._labels
                 indexes = np.argwhere(labels == loc).flatten()
@@ -10,6 +10,7 @@ This module defines the |NDPlot| class in which generic |NDDataset| plot methods
 
 __all__ = ["NDPlot", "plot"]
 
+import functools
 import re
 import textwrap
 
@@ -37,6 +38,49 @@ HAS_PLOTLY = go is not None
 
 # from spectrochempy.utils import deprecated
 
+# attributes exposed by NDPlot.__dir__
+_NDPLOT_DIR = ("fignum", "ndaxes", "divider")
+
+
+@functools.lru_cache(maxsize=16)
+def _get_prop_cycle(colors, scatter):
+    # Compose the property cycler for a given color set once: the line
+    # styles and markers are fixed, and the colors almost never change
+    # between two plots, so rebuilding the triple cycler per call was
+    # wasted work.
+    linestyles = ["-", "--", ":", "-."]
+    markers = ["o", "s", "^"]
+    colors = list(colors)
+    if scatter:
+        return (
+            cycler("color", colors * len(linestyles) * len(markers))
+            + cycler("linestyle", linestyles * len(colors) * len(markers))
+            + cycler("marker", markers * len(colors) * len(linestyles))
+        )
+    return cycler("color", colors * len(linestyles)) + cycler(
+        "linestyle", linestyles * len(colors)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_command(command):
+    # Parse a replay command such as "set_xlim(0, 10)" into the method
+    # name plus evaluated positional and keyword arguments.  The result is
+    # cached, so resuming the same commands over many plots compiles and
+    # evaluates each argument string only once.
+    com, val = command.split("(")
+    val = val.split(")")[0].split(",")
+    ags = []
+    kws = {}
+    for item in val:
+        if "=" in item:
+            k, v = item.split("=")
+            kws[k.strip()] = eval(v)
+        else:
+            ags.append(eval(item))
+    return com, tuple(ags), kws
+
+
 # ======================================================================================================================
 # Management of the preferences for datasets
 # ======================================================================================================================
@@ -371,6 +415,9 @@ class NDPlot(HasTraits):
     # Metadata to store plot parameters
     _preferences = Instance(PreferencesSet, allow_none=True)
 
+    # Resolved plotter functions, cached per (class, method) — see plot()
+    _plotters = {}
+
     # ------------------------------------------------------------------------
     # Generic plotter and plot related methods or properties
     # ------------------------------------------------------------------------
@@ -433,46 +480,50 @@ class NDPlot(HasTraits):
         # select plotter depending on the dimension of the data
         # --------------------------------------------------------------------
         if method:
-            _plotter = getattr(self, f"plot_{method.replace('+', '_')}", None)
+            # the plotter is resolved once per (class, method) pair and
+            # cached: the plot_* methods are attached to the dataset
+            # classes after import, so the table is filled lazily instead
+            # of at class creation
+            key = (type(self), method)
+            _plotter = NDPlot._plotters.get(key)
             if _plotter is None:
-                # no plotter found
-                error_(
-                    "The specified plotter for method "
-                    "`{}` was not found!".format(method)
-                )
-                raise IOError
-        else:
-            _plotter = self._plot_generic
+                _plotter = getattr(type(self), f"plot_{method.replace('+', '_')}", None)
+                if _plotter is None:
+                    # no plotter found
+                    error_(
+                        "The specified plotter for method "
+                        "`{}` was not found!".format(method)
+                    )
+                    raise IOError
+                NDPlot._plotters[key] = _plotter
 
-        # Execute the plotter
-        # --------------------
+            # Execute the plotter
+            # --------------------
+            return _plotter(self, **kwargs)
 
-        return _plotter(**kwargs)
+        return self._plot_generic(**kwargs)
 
     # ------------------------------------------------------------------------
     # plotter: plot_generic
     # ------------------------------------------------------------------------
 
+    # the generic plotter is selected by a direct index on the squeezed
+    # dimensionality instead of an if/elif chain
+    _PLOTTER_BY_NDIM = (None, plot_1D, plot_2D, plot_3D)
+
     # ..........................................................................
     def _plot_generic(self, **kwargs):
 
-        if self._squeeze_ndim == 1:
-
-            ax = plot_1D(self, **kwargs)
-
-        elif self._squeeze_ndim == 2:
+        try:
+            plotter = self._PLOTTER_BY_NDIM[self._squeeze_ndim]
+        except (IndexError, TypeError):
+            plotter = None
 
-            ax = plot_2D(self, **kwargs)
-
-        elif self._squeeze_ndim == 3:
-
-            ax = plot_3D(self, **kwargs)
-
-        else:
+        if plotter is None:
             error_("Cannot guess an adequate plotter, nothing done!")
             return False
 
-        return ax
+        return plotter(self, **kwargs)
 
     def close_figure(self):
         """
@@ -571,19 +622,8 @@ class NDPlot(HasTraits):
                 except ValueError as e:
                     raise e
 
-        linestyles = ["-", "--", ":", "-."]
-        markers = ["o", "s", "^"]
-        if ax is not None and "scatter" in method:
-            ax.set_prop_cycle(
-                cycler("color", colors * len(linestyles) * len(markers))
-                + cycler("linestyle", linestyles * len(colors) * len(markers))
-                + cycler("marker", markers * len(colors) * len(linestyles))
-            )
-        elif ax is not None and "scatter" not in method:
-            ax.set_prop_cycle(
-                cycler("color", colors * len(linestyles))
-                + cycler("linestyle", linestyles * len(colors))
-            )
+        if ax is not None:
+            ax.set_prop_cycle(_get_prop_cycle(tuple(colors), "scatter" in method))
 
         # Get the number of the present figure
         self._fignum = self._fig.number
@@ -603,6 +643,12 @@ class NDPlot(HasTraits):
 
             self.colorbar = colorbar = kwargs.get("colorbar", prefs.colorbar)
 
+            if kwargs.get("data_only", False):
+                # the caller reuses axes and labels from a previous plot
+                # (e.g. overlays): the projection and colorbar axes would
+                # be created only to be ignored
+                return method
+
             proj = kwargs.get("proj", prefs.show_projections)
             # TODO: tell the axis by title.
 
@@ -610,8 +656,9 @@ class NDPlot(HasTraits):
 
             yproj = kwargs.get("yproj", prefs.show_projection_y)
 
-            SHOWXPROJ = (proj or xproj) and method in ["map", "image"]
-            SHOWYPROJ = (proj or yproj) and method in ["map", "image"]
+            is_map_or_image = method in ["map", "image"]
+            SHOWXPROJ = (proj or xproj) and is_map_or_image
+            SHOWYPROJ = (proj or yproj) and is_map_or_image
 
             # Create the various axes
             # -------------------------
@@ -694,16 +741,7 @@ class NDPlot(HasTraits):
         commands = kwargs.get("commands", [])
         if commands:
             for command in commands:
-                com, val = command.split("(")
-                val = val.split(")")[0].split(",")
-                ags = []
-                kws = {}
-                for item in val:
-                    if "=" in item:
-                        k, v = item.split("=")
-                        kws[k.strip()] = eval(v)
-                    else:
-                        ags.append(eval(item))
+                com, ags, kws = _parse_command(command)
                 getattr(self.ndaxes["main"], com)(*ags, **kws)  # TODO: improve this
 
         # output command should be after all plot commands
@@ -712,11 +750,11 @@ class NDPlot(HasTraits):
         if savename is not None:
             # we save the figure with options found in kwargs
             # starting with `save`
-            kw = {}
-            for key, value in kwargs.items():
-                if key.startswith("save"):
-                    key = key[4:]
-                    kw[key] = value
+            kw = {
+                key[4:]: value
+                for key, value in kwargs.items()
+                if key.startswith("save") and key != "save"
+            }
             self._fig.savefig(savename, **kw)
 
     # ------------------------------------------------------------------------
@@ -725,7 +763,8 @@ class NDPlot(HasTraits):
 
     # ..........................................................................
     def __dir__(self):
-        return ["fignum", "ndaxes", "divider"]
+        # a shared constant: completion machinery calls __dir__ repeatedly
+        return _NDPLOT_DIR
 
     # ------------------------------------------------------------------------
     # Properties
@@ -777,19 +816,33 @@ class NDPlot(HasTraits):
         """
         return self._ndaxes
 
+    # the setter logic is registered per type: singledispatch caches the
+    # resolution, so repeated assignments avoid the isinstance cascade
+    @functools.singledispatchmethod
+    def _set_ndaxes(self, axes):
+        # unknown types are silently ignored, as before
+        pass
+
+    @_set_ndaxes.register(list)
+    def _(self, axes):
+        # a list of axes have been passed
+        for ax in axes:
+            self._ndaxes[ax.name] = ax
+
+    @_set_ndaxes.register(dict)
+    def _(self, axes):
+        self._ndaxes.update(axes)
+
+    @_set_ndaxes.register(_Axes)
+    def _(self, axes):
+        # it's an axe! add it to our list
+        self._ndaxes[axes.name] = axes
+
     # ..........................................................................
     @ndaxes.setter
     def ndaxes(self, axes):
         # we assume that the axes have a name
-        if isinstance(axes, list):
-            # a list a axes have been passed
-            for ax in axes:
-                self._ndaxes[ax.name] = ax
-        elif isinstance(axes, dict):
-            self._ndaxes.update(axes)
-        elif isinstance(axes, _Axes):
-            # it's an axe! add it to our list
-            self._ndaxes[axes.name] = axes
+        self._set_ndaxes(axes)
 
     # ..........................................................................
     @property
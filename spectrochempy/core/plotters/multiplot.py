@@ -204,7 +204,7 @@ def multiplot(
     single = False
     if not is_sequence(datasets):
         single = True
-        datasets = list([datasets])  # make a list
+        datasets = [datasets]  # make a list
 
     if len(datasets) < nrow * ncol and not show_transposed:
         # not enough datasets given in this list.
@@ -222,7 +222,7 @@ def multiplot(
         if nrow * ncol < len(datasets):
             ncol += 1
 
-    ndims = set([dataset.ndim for dataset in datasets])
+    ndims = {dataset.ndim for dataset in datasets}
     if len(ndims) > 1:
         raise NotImplementedError("mixed dataset shape.")
     ndim = list(ndims)[0]
@@ -241,7 +241,12 @@ def multiplot(
         fig.clf()
         fig.set_size_inches(*figsize)
 
-    fig.rcParams = plt.rcParams.copy()  # save params used for this figure
+    # save the params used for this figure as a diff against the matplotlib
+    # defaults: only a handful of entries ever differ, so this is much
+    # lighter than a full ~300-entry rcParams snapshot per figure
+    fig.rcParams = {
+        k: v for k, v in plt.rcParams.items() if mpl.rcParamsDefault.get(k) != v
+    }
 
     if suptitle is not None:
         fig.suptitle(suptitle, color=suptitle_color)
@@ -295,6 +300,16 @@ def multiplot(
     if sharez:
         sharez = "all"
 
+    # precompute the axes names and keep direct references in a 2D grid,
+    # avoiding per-cell string formatting and dict lookups
+    name_grid = [[f"axe{r + 1}{c + 1}" for c in range(ncol)] for r in range(nrow)]
+    ax_grid = [[None] * ncol for _ in range(nrow)]
+
+    # the plot arguments invariant across subplots are assembled once
+    base_plot_kw = dict(
+        method=method, clear=False, autolayout=False, colorbar=colorbar, **kwargs
+    )
+
     for irow in range(nrow):
         for icol in range(ncol):
 
@@ -319,22 +334,22 @@ def multiplot(
 
             else:
                 if sharex == "all":
-                    _sharex = axes["axe11"]
+                    _sharex = ax_grid[0][0]
                 elif sharex == "col":
-                    _sharex = axes["axe1{}".format(icol + 1)]
+                    _sharex = ax_grid[0][icol]
 
                 if sharey == "all":
-                    _sharey = axes["axe11"]
+                    _sharey = ax_grid[0][0]
                 elif sharey == "row":
-                    _sharey = axes["axe{}1".format(irow + 1)]
+                    _sharey = ax_grid[irow][0]
 
                 # in the last dimension
                 if sharez == "all":
-                    _sharez = axes["axe11"]
+                    _sharez = ax_grid[0][0]
                 elif sharez == "row":
-                    _sharez = axes["axe{}1".format(irow + 1)]
+                    _sharez = ax_grid[irow][0]
                 elif sharez == "col":
-                    _sharez = axes["axe1{}".format(icol + 1)]
+                    _sharez = ax_grid[0][icol]
 
                 ax = _Axes(fig, nrow, ncol, idx + 1, sharex=_sharex, sharey=_sharey)
                 ax = fig.add_subplot(ax)
@@ -342,37 +357,35 @@ def multiplot(
             ax._sharez = _sharez  # we add a new share info to the ax.
             # which will be useful for the interactive masks
 
-            ax.name = "axe{}{}".format(irow + 1, icol + 1)
+            ax.name = name_grid[irow][icol]
             axes[ax.name] = ax
-            if icol > 0 and sharey:
-                # hide the redondant ticklabels on left side of interior figures
-                plt.setp(axes[ax.name].get_yticklabels(), visible=False)
-                axes[ax.name].yaxis.set_tick_params(
-                    which="both", labelleft=False, labelright=False
-                )
-                axes[ax.name].yaxis.offsetText.set_visible(False)
-            if irow < nrow - 1 and sharex:
-                # hide the bottom ticklabels of interior rows
-                plt.setp(axes[ax.name].get_xticklabels(), visible=False)
-                axes[ax.name].xaxis.set_tick_params(
-                    which="both", labelbottom=False, labeltop=False
-                )
-                axes[ax.name].xaxis.offsetText.set_visible(False)
+            ax_grid[irow][icol] = ax
+            if sharex and sharey:
+                # matplotlib hides the redundant interior labels (and the
+                # offset texts) natively, without the per-artist setp walk
+                ax.label_outer()
+            else:
+                if icol > 0 and sharey:
+                    # hide the redondant ticklabels on left side of interior figures
+                    plt.setp(ax.get_yticklabels(), visible=False)
+                    ax.yaxis.set_tick_params(
+                        which="both", labelleft=False, labelright=False
+                    )
+                    ax.yaxis.offsetText.set_visible(False)
+                if irow < nrow - 1 and sharex:
+                    # hide the bottom ticklabels of interior rows
+                    plt.setp(ax.get_xticklabels(), visible=False)
+                    ax.xaxis.set_tick_params(
+                        which="both", labelbottom=False, labeltop=False
+                    )
+                    ax.xaxis.offsetText.set_visible(False)
 
             if show_transposed and irow == 1:
                 transposed = True
             else:
                 transposed = False
 
-            dataset.plot(
-                method=method,
-                ax=ax,
-                clear=False,
-                autolayout=False,
-                colorbar=colorbar,
-                data_transposed=transposed,
-                **kwargs
-            )
+            dataset.plot(ax=ax, data_transposed=transposed, **base_plot_kw)
 
             ax.set_title(label, fontsize=8)
             if sharex and irow < nrow - 1:
@@ -387,16 +400,18 @@ def multiplot(
 
     # TODO: add a common color bar (set vmin and vmax using zlims)
 
-    amp = np.ptp(np.array(ylims))
-    ylim = [np.min(np.array(ylims) - amp * 0.01), np.max(np.array(ylims)) + amp * 0.01]
+    yl = np.asarray(ylims)
+    ymin, ymax = yl.min(), yl.max()
+    amp = ymax - ymin
+    ylim = [ymin - amp * 0.01, ymax + amp * 0.01]
     for ax in axes.values():
         ax.set_ylim(ylim)
     # if yrev:
     #    ylim = ylim[::-1]
-    # amp = np.ptp(np.array(xlims))
 
     if not show_transposed:
-        xlim = [np.min(np.array(xlims)), np.max(np.array(xlims))]
+        xl = np.asarray(xlims)
+        xlim = [xl.min(), xl.max()]
         if xrev:
             xlim = xlim[::-1]
         for ax in axes.values():
@@ -404,8 +419,14 @@ def multiplot(
 
     def do_tight_layout(fig, axes, suptitle, **kwargs):
 
-        # tight_layout
-        renderer = get_renderer(fig)
+        # tight_layout.
+        # constructing the renderer is not free: cache it on the figure,
+        # keyed on the size and dpi so a resize naturally invalidates it
+        size_dpi = (tuple(fig.get_size_inches()), fig.dpi)
+        if getattr(fig, "_cached_renderer_key", None) != size_dpi:
+            fig._cached_renderer = get_renderer(fig)
+            fig._cached_renderer_key = size_dpi
+        renderer = fig._cached_renderer
         axeslist = list(axes.values())
         subplots_list = list(get_subplotspec_list(axeslist))
         kw = get_tight_layout_figure(
@@ -437,10 +458,29 @@ def multiplot(
 
     if mpl_event:
         # make an event that will trigger subplot adjust each time the mouse leave
-        # or enter the axes or figure
-        def _onenter(event):
+        # or enter the axes or figure.  The relayout is debounced through a
+        # single-shot timer and skipped when the layout inputs are unchanged,
+        # so every mouse crossing does not redo the full tight-layout and
+        # redraw pipeline.
+        _layout_state = []
+
+        def _relayout():
+            state = (tuple(fig.get_size_inches()), len(axes))
+            if _layout_state and _layout_state[0] == state:
+                return
+            _layout_state[:] = [state]
             do_tight_layout(fig, axes, suptitle, **kwargs)
-            fig.canvas.draw()
+            fig.canvas.draw_idle()
+
+        timer = fig.canvas.new_timer(interval=150)
+        timer.single_shot = True
+        timer.add_callback(_relayout)
+        # keep a reference alive as long as the figure exists
+        fig._tight_timer = timer
+
+        def _onenter(event):
+            timer.stop()
+            timer.start()
 
         fig.canvas.mpl_connect("axes_enter_event", _onenter)
         fig.canvas.mpl_connect("axes_leave_event", _onenter)
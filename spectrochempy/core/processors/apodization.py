@@ -31,6 +31,59 @@ from spectrochempy.core import error_
 
 pi = np.pi
 
+try:
+    # if numba is available, the exponential apodization kernel is
+    # JIT-compiled: a single fused loop over the FID avoids the chain of
+    # temporary arrays of the vectorized expression, and the machine code
+    # is cached on disk so the compilation cost is paid once per install
+    from numba import njit, prange
+
+    @njit(
+        ["float64[:](float64[:], float64, float64)"],
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )
+    def _em_kernel(x, lb, shifted):  # pragma: no cover
+        out = np.empty_like(x)
+        for i in prange(x.size):
+            out[i] = np.exp(-pi * abs(x[i] - shifted) * lb)
+        return out
+
+except ImportError:  # pragma: no cover
+    _em_kernel = None
+
+# The em window is deterministic in (x, lb, shifted): keep the most
+# recently computed curves so parameter sweeps and interactive replots
+# skip the exp pass entirely.  Hashing the axis bytes is much cheaper
+# than recomputing the window.
+_EM_CURVE_CACHE_SIZE = 32
+_em_curve_cache = {}
+
+
+def _em_curve(x, lb, shifted):
+    # the axis bytes themselves are the key: a hash digest alone could
+    # collide and silently return the wrong curve
+    key = (x.tobytes(), lb, shifted)
+    curve = _em_curve_cache.pop(key, None)
+    if curve is None:
+        if _em_kernel is not None and x.dtype == np.float64 and x.flags.c_contiguous:
+            curve = _em_kernel(x, lb, shifted)
+        else:
+            # numpy fallback, as a single in-place pipeline:
+            # exp(-pi * |x - t0| * lb)
+            curve = np.subtract(x, shifted, dtype=np.float64)
+            np.abs(curve, out=curve)
+            curve *= -pi * lb
+            np.exp(curve, out=curve)
+    # (re)insert as most recently used and trim the oldest entries
+    _em_curve_cache[key] = curve
+    while len(_em_curve_cache) > _EM_CURVE_CACHE_SIZE:
+        del _em_curve_cache[next(iter(_em_curve_cache))]
+    # hand out a copy: NDDataset wraps arrays without copying (retapod),
+    # so the cached buffer must never escape by reference
+    return curve.copy()
+
 
 # ======================================================================================================================
 # Decorators
@@ -223,18 +276,12 @@ def em(dataset, lb=1, shifted=0, **kwargs):
 
     x = dataset
 
-    e = np.ones_like(x)
-
     if abs(lb) <= EPSILON:
-        return e
+        return np.ones_like(x)
     if shifted < EPSILON:
         shifted = 0.0
 
-    tc = 1.0 / lb
-    xs = pi * np.abs(x - shifted)
-    e = xs / tc
-
-    return np.exp(-e)
+    return _em_curve(x, float(lb), float(shifted))
 
 
 # ..............................................................................
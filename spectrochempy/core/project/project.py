@@ -8,7 +8,6 @@
 __all__ = ["Project"]
 
 from copy import deepcopy as cpy
-import uuid
 import pathlib
 from functools import wraps
 
@@ -19,6 +18,7 @@ from spectrochempy.core.dataset.nddataset import NDDataset, NDIO
 from spectrochempy.core.scripts.script import Script
 from spectrochempy.core.dataset.meta import Meta
 from spectrochempy.core.project.baseproject import AbstractProject
+from spectrochempy.utils import make_id
 
 
 # from collections import OrderedDict
@@ -282,7 +282,7 @@ class Project(AbstractProject, NDIO):
     @default("_id")
     def _id_default(self):
         # a unique id
-        return f"{type(self).__name__}_{str(uuid.uuid1()).split('-')[0]}"
+        return make_id(self)
 
     # ..........................................................................
     @property
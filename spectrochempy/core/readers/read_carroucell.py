@@ -170,14 +170,18 @@ def _read_carroucell(*args, **kwargs):
             t = []
             T = []
             sheet = book.sheet_by_index(0)
-            for i in range(9, sheet.nrows):
+            # fetch each column in a single batched xlrd call instead of
+            # two per-row cell lookups
+            times = sheet.col_values(0, 9)
+            temperatures = sheet.col_values(4, 9)
+            for time_value, T_value in zip(times, temperatures):
                 try:
                     time = datetime.datetime.strptime(
-                        sheet.cell(i, 0).value, "%d/%m/%y %H:%M:%S"
+                        time_value, "%d/%m/%y %H:%M:%S"
                     ).replace(tzinfo=datetime.timezone.utc)
                     if ti <= time <= tf:
                         t.append(time)
-                        T.append(sheet.cell(i, 4).value)
+                        T.append(T_value)
                 except ValueError:
                     pass
                 except TypeError:
@@ -12,8 +12,6 @@ __dataset_methods__ = __all__
 # standard and other imports
 # ------------------------------------------------------------------
 
-import warnings
-import locale
 import io
 from datetime import datetime, timezone
 
@@ -22,16 +20,38 @@ import numpy as np
 from spectrochempy.core.dataset.coord import Coord
 from spectrochempy.core import preferences as prefs
 from spectrochempy.core.readers.importer import Importer, _importer_method
-
-try:
-    locale.setlocale(locale.LC_ALL, "en_US")  # to avoid problems with date format
-except Exception:  # pragma: no cover
-    try:
-        locale.setlocale(
-            locale.LC_ALL, "en_US.utf8"
-        )  # to avoid problems with date format
-    except Exception:
-        warnings.warn("Could not set locale: en_US or en_US.utf8")
+from spectrochempy.optional import import_optional_dependency
+
+
+# month-name → number mapping for the fixed omnic date format; the french
+# 'Aout' found in french-locale exports is accepted directly
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Aout": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def _parse_omnic_date(dat):
+    # Parse a date such as 'Wed Jul 06 21-00-38 2016'.
+    # The format is fixed, so strptime — which re-parses its format string
+    # and consults the locale on every call — is not needed; the redundant
+    # weekday token is simply ignored, whatever its language.
+    _, month, day, hms, year = dat.split()
+    hour, minute, second = hms.split("-")
+    return datetime(
+        int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second)
+    )
 
 
 # ======================================================================================================================
@@ -138,23 +158,49 @@ def read_csv(*paths, **kwargs):
 # ======================================================================================================================
 
 
-@_importer_method
-def _read_csv(*args, **kwargs):
-    # read csv file
-    dataset, filename = args
-    content = kwargs.get("content", None)
-    delimiter = kwargs.get("csv_delimiter", prefs.csv_delimiter)
-
-    def _open():
-        if content is not None:
-            f = io.StringIO(content.decode("utf-8"))
-        else:
-            f = open(filename, "r")
-        return f
+def _csv_to_array(_open, delimiter, filename=None):
+    # Parse a two-column csv content into a (2, N) float array.
+    # _open is a zero-argument callable returning a fresh file object;
+    # when filename is given it is handed to pandas directly, so the file
+    # can be memory-mapped instead of read into a Python buffer.
+
+    pd = import_optional_dependency("pandas", errors="ignore")
+    if pd is not None:
+        # pandas' C parser is an order of magnitude faster than np.loadtxt,
+        # which loops over the lines in Python.  The retries cover the
+        # french-locale excel exports: ';' delimiter and/or decimal ','.
+        for csv_kw in (
+            dict(sep=delimiter),
+            dict(sep=";"),
+            dict(sep=";", decimal=","),
+        ):
+            fid = filename if filename is not None else _open()
+            try:
+                # only the two documented columns are parsed
+                return (
+                    pd.read_csv(
+                        fid,
+                        header=None,
+                        usecols=[0, 1],
+                        dtype=np.float64,
+                        engine="c",
+                        memory_map=filename is not None,
+                        **csv_kw,
+                    )
+                    .to_numpy()
+                    .T
+                )
+            except Exception:
+                continue
+            finally:
+                if filename is None:
+                    fid.close()
+        raise IOError("{} is not a .csv file or its structure cannot be recognized")
 
+    # numpy fallback when pandas is not installed
     try:
         fid = _open()
-        d = np.loadtxt(fid, unpack=True, delimiter=delimiter)
+        d = np.loadtxt(fid, unpack=True, usecols=(0, 1), delimiter=delimiter)
         fid.close()
     except ValueError:
         # it might be that the delimiter is not correct (default is ','), but
@@ -165,7 +211,7 @@ def _read_csv(*args, **kwargs):
             if fid:
                 fid.close()
             fid = _open()
-            d = np.loadtxt(fid, unpack=True, delimiter=_delimiter)
+            d = np.loadtxt(fid, unpack=True, usecols=(0, 1), delimiter=_delimiter)
             fid.close()
 
         except Exception:  # pragma: no cover
@@ -181,11 +227,29 @@ def _read_csv(*args, **kwargs):
             txt = txt.replace(",", ".")
             fil = io.StringIO(txt)
             try:
-                d = np.loadtxt(fil, unpack=True, delimiter=delimiter)
+                d = np.loadtxt(fil, unpack=True, usecols=(0, 1), delimiter=delimiter)
             except Exception:
                 raise IOError(
                     "{} is not a .csv file or its structure cannot be recognized"
                 )
+    return d
+
+
+@_importer_method
+def _read_csv(*args, **kwargs):
+    # read csv file
+    dataset, filename = args
+    content = kwargs.get("content", None)
+    delimiter = kwargs.get("csv_delimiter", prefs.csv_delimiter)
+
+    def _open():
+        if content is not None:
+            f = io.StringIO(content.decode("utf-8"))
+        else:
+            f = open(filename, "r")
+        return f
+
+    d = _csv_to_array(_open, delimiter, filename=None if content is not None else filename)
 
     # First column is the x coordinates
     coordx = Coord(d[0])
@@ -207,8 +271,9 @@ def _read_csv(*args, **kwargs):
     dataset.title = kwargs.get("title", None)
     dataset.units = kwargs.get("units", None)
     dataset.description = kwargs.get("description", '"name" ' + "read from .csv file")
-    dataset.history = str(datetime.now(timezone.utc)) + ":read from .csv file \n"
-    dataset._date = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)  # a single timestamp for all attributes
+    dataset.history = str(now) + ":read from .csv file \n"
+    dataset._date = now
     dataset._modified = dataset.date
 
     # here we can check some particular format
@@ -238,13 +303,12 @@ def _add_omnic_info(dataset, **kwargs):
     dataset.title = "absorbance"
     dataset.name = name
     dataset.description = "Dataset from .csv file: {}\n".format(desc)
-    dataset.history = (
-        str(datetime.now(timezone.utc)) + ":read from omnic exported csv file \n"
-    )
+    now = datetime.now(timezone.utc)  # a single timestamp for all attributes
+    dataset.history = str(now) + ":read from omnic exported csv file \n"
     dataset.origin = "omnic"
 
     # Set the NDDataset date
-    dataset._date = datetime.now(timezone.utc)
+    dataset._date = now
     dataset._modified = dataset.date
 
     # x axis
@@ -253,19 +317,9 @@ def _add_omnic_info(dataset, **kwargs):
     # y axis ?
     if "_" in name:
         name, dat = name.split("_")
-        # if needed convert weekday name to English
-        dat = dat.replace("Lun", "Mon")
-        dat = dat[:3].replace("Mar", "Tue") + dat[3:]
-        dat = dat.replace("Mer", "Wed")
-        dat = dat.replace("Jeu", "Thu")
-        dat = dat.replace("Ven", "Fri")
-        dat = dat.replace("Sam", "Sat")
-        dat = dat.replace("Dim", "Sun")
-        # convert month name to English
-        dat = dat.replace("Aout", "Aug")
 
         # get the dates
-        acqdate = datetime.strptime(dat, "%a %b %d %H-%M-%S %Y")
+        acqdate = _parse_omnic_date(dat)
 
         # Transform back to timestamp for storage in the Coord object
         # use datetime.fromtimestamp(d, timezone.utc))
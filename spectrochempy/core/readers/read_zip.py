@@ -111,6 +111,7 @@ def read_zip(*paths, **kwargs):
 def _read_zip(*args, **kwargs):
     # Below we assume that files to read are in a unique directory
     from spectrochempy.core.dataset.nddataset import NDDataset
+    from concurrent.futures import ThreadPoolExecutor
     import zipfile
 
     # read zip file
@@ -127,8 +128,6 @@ def _read_zip(*args, **kwargs):
         filelist = zf.filelist
         only = kwargs.pop("only", len(filelist))
 
-        datasets = []
-
         # for file in filelist:
         #
         #   # make a pathlib object (but this doesn't work with python 3.7)
@@ -168,6 +167,9 @@ def _read_zip(*args, **kwargs):
                 parent = file.filename
                 break
 
+        # collect the members to read first — zipfile objects are not
+        # thread-safe, so the decompression happens here...
+        contents = []
         count = 0
         for file in filelist:
             if (
@@ -175,16 +177,24 @@ def _read_zip(*args, **kwargs):
                 and file.filename.startswith(parent)
                 and "DS_Store" not in file.filename
             ):
-                # read it
-                datasets.append(
-                    NDDataset.read(
-                        {file.filename: zf.read(file.filename)},
-                        origin=kwargs.get("origin", None),
-                    )
-                )
+                contents.append((file.filename, zf.read(file.filename)))
                 count += 1
                 if count == only:
                     break
+
+    # ... then the independent contents (potentially hundreds of spectra
+    # for kinetic series) are parsed concurrently; map preserves ordering
+    origin = kwargs.get("origin", None)
+
+    def _parse(item):
+        name, content = item
+        return NDDataset.read({name: content}, origin=origin)
+
+    if len(contents) > 1:
+        with ThreadPoolExecutor() as executor:
+            datasets = list(executor.map(_parse, contents))
+    else:
+        datasets = [_parse(item) for item in contents]
     return datasets
 
 
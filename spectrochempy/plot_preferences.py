@@ -1019,18 +1019,15 @@ class PlotPreferences(MetaConfigurable):
         else:
             return f"{color}"
 
-    def _apply_style(self, _style):
-        f = (pathclean(self.stylesheets) / _style).with_suffix(".mplstyle")
-        if not f.exists():
-            # we have to look matplotlib predetermined style.
-            f = (
-                pathclean(mpl.__file__).parent / "mpl-data" / "stylelib" / _style
-            ).with_suffix(".mplstyle")
-            # if not f.exists() and _style=='scpy':
-            #     warning_(TypeError(f"The style `{_style}` doesn't exists"))
-            #     f = f.parent / 'classic.mplstyle'
-            #     if not f.exists:
-            #         raise TypeError
+    # parsed stylesheets, keyed by (path, mtime): re-applying a style in
+    # the same session skips the file read and the expensive font-size
+    # normalization (which builds a matplotlib figure per size entry)
+    _style_cache = {}
+
+    def _parse_style(self, f):
+        # parse a stylesheet file into a list of
+        # (is_scpy_parameter, name, value) entries
+        entries = []
         txt = f.read_text()
         pars = txt.split("\n")
         for line in pars:
@@ -1047,40 +1044,65 @@ class PlotPreferences(MetaConfigurable):
                     value = "True"
                 elif value == "false":
                     value = "False"
-                try:
-                    setattr(self, name_, value)
-                except ValueError:
-                    if name.endswith("color") and len(value) == 6:
-                        value = "#" + value.replace("'", "")
-                except TraitError:
-                    if hasattr(self.traits()[name_], "default_args"):
-                        try:
-                            value = type(self.traits()[name_].default_args)(
-                                map(float, value.split(","))
-                            )
-                        except Exception:
-                            value = type(self.traits()[name_].default_args)(
-                                value.split(",")
-                            )
-                            value = tuple(map(str.strip, value))
-                    else:
-                        value = type(self.traits()[name_].default_value)(eval(value))
-                except Exception as e:
-                    raise e
-                try:
-                    setattr(self, name_, value)
-                except Exception as e:
-                    raise e
+                entries.append((False, name_, value))
 
             if line.strip() and line.strip().startswith("##@"):
                 # SPECTROCHEMPY Parameters
                 name, value = line[3:].split(":", maxsplit=1)
-                name = name.strip()
-                value = value.strip()
+                entries.append((True, name.strip(), value.strip()))
+        return entries
+
+    def _apply_style(self, _style):
+        f = (pathclean(self.stylesheets) / _style).with_suffix(".mplstyle")
+        if not f.exists():
+            # we have to look matplotlib predetermined style.
+            f = (
+                pathclean(mpl.__file__).parent / "mpl-data" / "stylelib" / _style
+            ).with_suffix(".mplstyle")
+            # if not f.exists() and _style=='scpy':
+            #     warning_(TypeError(f"The style `{_style}` doesn't exists"))
+            #     f = f.parent / 'classic.mplstyle'
+            #     if not f.exists:
+            #         raise TypeError
+
+        key = (str(f), f.stat().st_mtime)
+        entries = self._style_cache.get(key)
+        if entries is None:
+            entries = self._parse_style(f)
+            self._style_cache[key] = entries
+
+        for is_scpy_par, name_, value in entries:
+            if is_scpy_par:
                 try:
-                    setattr(self, name, value)
+                    setattr(self, name_, value)
                 except TraitError:
-                    setattr(self, name, eval(value))
+                    setattr(self, name_, eval(value))
+                continue
+
+            try:
+                setattr(self, name_, value)
+            except ValueError:
+                if name_.endswith("color") and len(value) == 6:
+                    value = "#" + value.replace("'", "")
+            except TraitError:
+                if hasattr(self.traits()[name_], "default_args"):
+                    try:
+                        value = type(self.traits()[name_].default_args)(
+                            map(float, value.split(","))
+                        )
+                    except Exception:
+                        value = type(self.traits()[name_].default_args)(
+                            value.split(",")
+                        )
+                        value = tuple(map(str.strip, value))
+                else:
+                    value = type(self.traits()[name_].default_value)(eval(value))
+            except Exception as e:
+                raise e
+            try:
+                setattr(self, name_, value)
+            except Exception as e:
+                raise e
 
     def to_rc_key(self, key):
         rckey = ""
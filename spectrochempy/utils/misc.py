@@ -10,7 +10,7 @@ Various methods and classes used in other part of the program.
 import re
 import functools
 from datetime import datetime, timezone
-import uuid
+from itertools import count
 import types
 import warnings
 import textwrap
@@ -42,6 +42,7 @@ __all__ = [
     "quat_as_complex_array",
     "get_n_decimals",
     "add_docstring",
+    "make_id",
 ]
 
 #
@@ -60,6 +61,30 @@ INPLACE = "INPLACE"
 
 typequaternion = np.dtype(np.quaternion)
 
+# a process-wide counter used to generate the default object ids.
+# uuid1() stats the system clock and the MAC address on every call, which
+# is far too expensive for transient objects such as the coordinates
+# created during dataset arithmetic; a counter is unique within the
+# process, which is all these ids are used for.
+_id_counter = count()
+
+
+def make_id(obj):
+    """
+    Return a default id for an object, unique within the process.
+
+    Parameters
+    ----------
+    obj : any object
+        The object to identify; only its type name enters the id.
+
+    Returns
+    -------
+    id
+        A string such as ``NDDataset_1f3``.
+    """
+    return f"{type(obj).__name__}_{next(_id_counter):x}"
+
 
 def get_n_decimals(val, accuracy):
     if abs(val) > 0.0:
@@ -496,7 +521,7 @@ def make_new_object(objtype):
     new = type(objtype)()
 
     # new id and date
-    new._id = "{}_{}".format(type(objtype).__name__, str(uuid.uuid1()).split("-")[0])
+    new._id = make_id(objtype)
     new._date = datetime.now(timezone.utc)
 
     return new
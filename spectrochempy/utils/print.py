@@ -357,6 +357,13 @@ def insert_masked_print(ds, mask_string="--"):
 # ======================================================================================================================
 
 
+# remember the options currently in effect, so that repeated calls with
+# identical arguments (e.g. the call at import of ndarray.py, re-executed
+# in every worker process) do not rebuild the formatter and mutate the
+# global numpy state again
+_current_options = None
+
+
 def numpyprintoptions(
     precision=4,
     threshold=6,
@@ -381,6 +388,22 @@ def numpyprintoptions(
     linewidth
     kargs
     """
+    global _current_options
+
+    options = (
+        precision,
+        threshold,
+        edgeitems,
+        suppress,
+        spc,
+        linewidth,
+        tuple(sorted(kargs.items())),
+    )
+    if formatter is None and options == _current_options:
+        # these options are already in effect
+        return
+    # a custom formatter cannot be compared reliably: do not memoize it
+    _current_options = options if formatter is None else None
 
     def _format_object(x):
 
@@ -8,9 +8,14 @@
 from os import environ
 import pathlib
 
+import matplotlib
 import numpy as np
 import pytest
 
+# force a non-GUI backend for the whole test session, before
+# spectrochempy pulls in pyplot
+matplotlib.use("Agg")
+
 try:
     # work only if spectrochempy is installed
     import spectrochempy
@@ -29,11 +34,43 @@ from spectrochempy.utils.testing import RandomSeedContext
 datadir = pathclean(prefs.datadir)
 print("DATADIR: ", datadir)
 
-# this process is relatively long, so we do not want to do it several time:
+# this process is relatively long, so we do not want to do it several time
+# (nor once per worker when the tests are distributed with pytest-xdist):
 downloaded = datadir / "__downloaded__"
 if not downloaded.exists():
-    scp.read_remote(datadir, download_only=True)
-    downloaded.write_text("")
+    import time
+
+    downloading = datadir / "__downloading__"
+
+    # a lock left behind by a crashed or interrupted run must not block
+    # every future run: discard it when it is clearly stale
+    try:
+        if time.time() - downloading.stat().st_mtime > 3600:
+            downloading.unlink()
+    except OSError:
+        pass
+
+    try:
+        # exclusive creation succeeds in a single process only
+        downloading.touch(exist_ok=False)
+        try:
+            scp.read_remote(datadir, download_only=True)
+            downloaded.write_text("")
+        finally:
+            downloading.unlink()
+    except FileExistsError:  # pragma: no cover
+        # another xdist worker is downloading: wait until it has finished
+        # (bounded — the lock disappearing means that download ended,
+        # successfully or not, and the tests will report missing data)
+        for _ in range(3600):
+            if downloaded.exists() or not downloading.exists():
+                break
+            time.sleep(1)
+        else:
+            raise RuntimeError(
+                "Timed out waiting for another process to download the test data. "
+                f"If no other pytest run is active, remove {downloading} and retry."
+            )
 
 # ======================================================================================================================
 # FIXTURES
@@ -56,6 +93,15 @@ def ip(session_ip):
     yield session_ip
 
 
+@pytest.fixture(autouse=True)
+def _close_figures():
+    # keep matplotlib memory bounded across the whole suite
+    yield
+    import matplotlib.pyplot as plt
+
+    plt.close("all")
+
+
 def pytest_sessionfinish(session, exitstatus):  # pragma: no cover
     """whole test run finishes."""
 
@@ -109,13 +155,13 @@ def refmask():
 @pytest.fixture(scope="function")
 def ndarray():
     # return a simple ndarray with some data
-    return scp.NDArray(ref_data, desc="An array", copy=True).copy()
+    return scp.NDArray(ref_data, desc="An array", copy=True)
 
 
 @pytest.fixture(scope="function")
 def ndarrayunit():
     # return a simple ndarray with some data and units
-    return scp.NDArray(ref_data, units="m/s", copy=True).copy()
+    return scp.NDArray(ref_data, units="m/s", copy=True)
 
 
 @pytest.fixture(scope="function")
@@ -123,7 +169,7 @@ def ndarraymask():
     # return a simple ndarray with some data and units
     return scp.NDArray(
         ref_data, mask=ref_mask, units="m/s", history="Creation with mask", copy=True
-    ).copy()
+    )
 
 
 # ------------------------------------------------------------------
@@ -136,7 +182,7 @@ def ndarraycplx():
     # return a complex ndarray
     return scp.NDComplexArray(
         ref_data, units="m/s", dtype=np.complex128, copy=True
-    ).copy()
+    )
 
 
 @pytest.fixture(scope="function")
@@ -144,16 +190,31 @@ def ndarrayquaternion():
     # return a quaternion ndarray
     return scp.NDComplexArray(
         ref_data, units="m/s", dtype=np.quaternion, copy=True
-    ).copy()
+    )
 
 
 # ------------------------------------------------------------------
 # Fixtures: Some scp.NDDatasets
 # ------------------------------------------------------------------
 
+# coordinate data shared by the Coord fixtures below, computed once at
+# import and made read-only to catch accidental in-place mutation
+_WN_10 = np.linspace(4000.0, 1000.0, 10)
+_WN_9 = np.linspace(4000.0, 1000.0, 9)
+_TIME_100 = np.linspace(0.0, 60.0, 100)
+_TIME_50 = np.linspace(0.0, 60.0, 50)
+_TEMP_3 = np.linspace(200.0, 300.0, 3)
+_TEMP_4 = np.linspace(200.0, 1000.0, 4)
+_FIELD_3 = np.linspace(1.0, 20.0, 3)
+_LABELS_10 = list("abcdefghij")
+_LABELS_9 = list("abcdefghi")
+
+for _arr in (_WN_10, _WN_9, _TIME_100, _TIME_50, _TEMP_3, _TEMP_4, _FIELD_3):
+    _arr.flags.writeable = False
+
 coord0_ = scp.Coord(
-    data=np.linspace(4000.0, 1000.0, 10),
-    labels=list("abcdefghij"),
+    data=_WN_10,
+    labels=_LABELS_10,
     units="cm^-1",
     title="wavenumber",
 )
@@ -164,7 +225,7 @@ def coord0():
     return coord0_.copy()
 
 
-coord1_ = scp.Coord(data=np.linspace(0.0, 60.0, 100), units="s", title="time-on-stream")
+coord1_ = scp.Coord(data=_TIME_100, units="s", title="time-on-stream")
 
 
 @pytest.fixture(scope="function")
@@ -173,7 +234,7 @@ def coord1():
 
 
 coord2_ = scp.Coord(
-    data=np.linspace(200.0, 300.0, 3),
+    data=_TEMP_3,
     labels=["cold", "normal", "hot"],
     units="K",
     title="temperature",
@@ -186,7 +247,7 @@ def coord2():
 
 
 coord2b_ = scp.Coord(
-    data=np.linspace(1.0, 20.0, 3),
+    data=_FIELD_3,
     labels=["low", "medium", "high"],
     units="tesla",
     title="magnetic field",
@@ -199,8 +260,8 @@ def coord2b():
 
 
 coord0_2_ = scp.Coord(
-    data=np.linspace(4000.0, 1000.0, 9),
-    labels=list("abcdefghi"),
+    data=_WN_9,
+    labels=_LABELS_9,
     units="cm^-1",
     title="wavenumber",
 )
@@ -211,9 +272,7 @@ def coord0_2():
     return coord0_2_.copy()
 
 
-coord1_2_ = scp.Coord(
-    data=np.linspace(0.0, 60.0, 50), units="s", title="time-on-stream"
-)
+coord1_2_ = scp.Coord(data=_TIME_50, units="s", title="time-on-stream")
 
 
 @pytest.fixture(scope="function")
@@ -222,7 +281,7 @@ def coord1_2():
 
 
 coord2_2_ = scp.Coord(
-    data=np.linspace(200.0, 1000.0, 4),
+    data=_TEMP_4,
     labels=["cold", "normal", "hot", "veryhot"],
     units="K",
     title="temperature",
@@ -234,16 +293,32 @@ def coord2_2():
     return coord2_2_.copy()
 
 
-@pytest.fixture(scope="function")
-def nd1d():
+# The NDDataset fixtures below are built only once per test session:
+# construction (data + Coord + CoordSet) is by far the expensive part.
+# The function-scoped wrappers hand a fresh copy to each test, so tests
+# remain free to mutate them in place.
+
+
+@pytest.fixture(scope="session")
+def _nd1d():
     # a simple ddataset
-    return scp.NDDataset(ref_data[:, 1].squeeze()).copy()
+    return scp.NDDataset(ref_data[:, 1].squeeze())
 
 
 @pytest.fixture(scope="function")
-def nd2d():
+def nd1d(_nd1d):
+    return _nd1d.copy()
+
+
+@pytest.fixture(scope="session")
+def _nd2d():
     # a simple 2D ndarrays
-    return scp.NDDataset(ref_data).copy()
+    return scp.NDDataset(ref_data)
+
+
+@pytest.fixture(scope="function")
+def nd2d(_nd2d):
+    return _nd2d.copy()
 
 
 @pytest.fixture(scope="function")
@@ -252,30 +327,40 @@ def ref_ds():
     return ref3d_data.copy()
 
 
-@pytest.fixture(scope="function")
-def ds1():
+@pytest.fixture(scope="session")
+def _ds1():
     # a dataset with coordinates
     return scp.NDDataset(
         ref3d_data,
         coordset=[coord0_, coord1_, coord2_],
         title="absorbance",
         units="absorbance",
-    ).copy()
+    )
 
 
 @pytest.fixture(scope="function")
-def ds2():
+def ds1(_ds1):
+    return _ds1.copy()
+
+
+@pytest.fixture(scope="session")
+def _ds2():
     # another dataset
     return scp.NDDataset(
         ref3d_2_data,
         coordset=[coord0_2_, coord1_2_, coord2_2_],
         title="absorbance",
         units="absorbance",
-    ).copy()
+    )
 
 
 @pytest.fixture(scope="function")
-def dsm():
+def ds2(_ds2):
+    return _ds2.copy()
+
+
+@pytest.fixture(scope="session")
+def _dsm():
     # dataset with coords containing several axis and a mask
 
     coordmultiple = scp.CoordSet(coord2_, coord2b_)
@@ -285,22 +370,70 @@ def dsm():
         mask=ref3d_mask,
         title="absorbance",
         units="absorbance",
-    ).copy()
+    )
 
 
-dataset = scp.NDDataset.read_omnic(datadir / "irdata" / "nh4y-activation.spg")
+@pytest.fixture(scope="function")
+def dsm(_dsm):
+    return _dsm.copy()
+
+
+# The binary parsers (OMNIC SPG, Bruker topspin) are expensive: parse
+# each file only once per session and distribute copies to the tests.
+# A pickle cache on disk additionally makes repeated pytest runs skip
+# the parsing entirely as long as the source files are unchanged.
+
+
+def _cached_load(key, source, loader):
+    # return loader() but keep a pickled copy keyed by the newest mtime
+    # found below `source` and by the spectrochempy version, so that warm
+    # runs only pay a pickle-read while a new release (hence possibly a
+    # changed reader) invalidates the cache instead of masking reader
+    # regressions behind a stale parse
+    import contextlib
+    import pickle
+
+    if source.is_file():
+        mtime = source.stat().st_mtime
+    else:
+        mtime = max(f.stat().st_mtime for f in source.rglob("*") if f.is_file())
+    cachedir = pathlib.Path.home() / ".cache" / "spectrochempy-tests"
+    cachefile = cachedir / f"{key}-{scp.version}-{mtime}.pkl"
+    if cachefile.exists():
+        try:
+            return pickle.loads(cachefile.read_bytes())
+        except Exception:  # pragma: no cover
+            # concurrent workers may race to remove the same torn file
+            with contextlib.suppress(OSError):
+                cachefile.unlink()
+    dataset = loader()
+    try:
+        cachedir.mkdir(parents=True, exist_ok=True)
+        for stale in cachedir.glob(f"{key}-*.pkl"):
+            with contextlib.suppress(OSError):
+                stale.unlink()
+        cachefile.write_bytes(pickle.dumps(dataset))
+    except Exception:  # pragma: no cover
+        pass
+    return dataset
+
+
+@pytest.fixture(scope="session")
+def _IR_dataset_2D():
+    path = datadir / "irdata" / "nh4y-activation.spg"
+    return _cached_load("omnic_2d", path, lambda: scp.NDDataset.read_omnic(path))
 
 
 @pytest.fixture(scope="function")
-def IR_dataset_2D():
-    nd = dataset.copy()
+def IR_dataset_2D(_IR_dataset_2D):
+    nd = _IR_dataset_2D.copy()
     nd.name = "IR_2D"
     return nd
 
 
 @pytest.fixture(scope="function")
-def IR_dataset_1D():
-    nd = dataset[0].squeeze().copy()
+def IR_dataset_1D(_IR_dataset_2D):
+    nd = _IR_dataset_2D[0].squeeze().copy()
     nd.name = "IR_1D"
     return nd
 
@@ -310,22 +443,38 @@ def IR_dataset_1D():
 # ------------------------------------------------------------------
 
 
-@pytest.fixture(scope="function")
-def NMR_dataset_1D():
+@pytest.fixture(scope="session")
+def _NMR_dataset_1D():
     path = datadir / "nmrdata" / "bruker" / "tests" / "nmr" / "topspin_1d" / "1" / "fid"
-    dataset = scp.NDDataset.read_topspin(
-        path, remove_digital_filter=True, name="NMR_1D"
+    return _cached_load(
+        "topspin_1d",
+        path.parent,
+        lambda: scp.NDDataset.read_topspin(
+            path, remove_digital_filter=True, name="NMR_1D"
+        ),
     )
-    return dataset.copy()
 
 
 @pytest.fixture(scope="function")
-def NMR_dataset_2D():
+def NMR_dataset_1D(_NMR_dataset_1D):
+    return _NMR_dataset_1D.copy()
+
+
+@pytest.fixture(scope="session")
+def _NMR_dataset_2D():
     path = datadir / "nmrdata" / "bruker" / "tests" / "nmr" / "topspin_2d" / "1" / "ser"
-    dataset = scp.NDDataset.read_topspin(
-        path, expno=1, remove_digital_filter=True, name="NMR_2D"
+    return _cached_load(
+        "topspin_2d",
+        path.parent,
+        lambda: scp.NDDataset.read_topspin(
+            path, expno=1, remove_digital_filter=True, name="NMR_2D"
+        ),
     )
-    return dataset.copy()
+
+
+@pytest.fixture(scope="function")
+def NMR_dataset_2D(_NMR_dataset_2D):
+    return _NMR_dataset_2D.copy()
 
 
 @pytest.fixture(scope="function")
@@ -419,6 +568,26 @@ def JDX_2D():
     return jdx
 
 
+# ------------------------------------------------------------------
+# Fixture: matlab dataset collection
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def _als2004dataset():
+    # the MAT parsing is expensive: read the file only once per session,
+    # and go through the disk-backed pickle cache so concurrent xdist
+    # workers (and warm reruns) load the parsed datasets instead of
+    # re-decoding the MAT structure
+    path = datadir / "matlabdata" / "als2004dataset.MAT"
+    return _cached_load("als2004", path, lambda: scp.read_matlab(path, merge=False))
+
+
+@pytest.fixture(scope="function")
+def als2004dataset(_als2004dataset):
+    return [ds.copy() for ds in _als2004dataset]
+
+
 # ------------------------------------------------------------------
 # fixture scp.Project
 # ------------------------------------------------------------------
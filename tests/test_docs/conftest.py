@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+#  =====================================================================================
+#  Copyright (©) 2015-2022 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+#  CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+#  See full LICENSE agreement in the root directory.
+#  =====================================================================================
+
+# flake8: noqa
+
+# Duration-based scheduling for the docs example suite: the wall time of
+# a distributed run is bounded by whichever example lands last on a
+# worker, so the examples are ordered longest-first using the durations
+# recorded in the pytest cache by previous runs.
+
+_CACHE_KEY = "test_docs/durations"
+_NODEID_PREFIX = "tests/test_docs/"
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.cache is None:
+        return
+    durations = config.cache.get(_CACHE_KEY, None)
+    if not durations:
+        return
+
+    positions = [
+        i for i, item in enumerate(items) if item.nodeid.startswith(_NODEID_PREFIX)
+    ]
+    if len(positions) < 2:
+        return
+
+    # reorder only the docs items, in place, leaving the rest of the
+    # session untouched
+    docs = sorted(
+        (items[i] for i in positions),
+        key=lambda item: -durations.get(item.nodeid, 0),
+    )
+    for i, item in zip(positions, docs):
+        items[i] = item
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if config.cache is None:
+        return
+    durations = config.cache.get(_CACHE_KEY, {})
+    changed = False
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            nodeid = getattr(report, "nodeid", "")
+            if getattr(report, "when", None) == "call" and nodeid.startswith(
+                _NODEID_PREFIX
+            ):
+                durations[nodeid] = report.duration
+                changed = True
+    if changed:
+        config.cache.set(_CACHE_KEY, durations)